@@ -1,3 +1,16 @@
+import json
+from numbers import Real
+
+# Valor mínimo (inclusive) de los parámetros enteros
+MIN_VALUES = {
+    'num_nodes': 3,                    # La triangulación de Delaunay requiere al menos 3 nodos
+    'num_clusters': 1,
+    'max_users_per_splitter': 1,
+}
+# Parámetros numéricos (o pares de coordenadas) que deben ser estrictamente positivos
+POSITIVE_PARAMS = ('area', 'max_distance_splitters')
+INPUT_TYPES = ('random', 'manual')
+
 class Config:
     def __init__(self):
         # Parámetros de generación de grafo
@@ -12,7 +25,97 @@ class Config:
 
         # Parámetros de clustering
         self.num_clusters = 5              # Número de clústeres (splitters de segunda etapa)
-        self.max_distance_splitters = 300  # Distancia máxima permitida para splitters (en metros)
+        self.max_distance_splitters = 300.0  # Distancia máxima permitida para splitters (en metros)
 
         # Restricciones adicionales
         self.max_users_per_splitter = 10   # Capacidad máxima de usuarios por splitter
+
+    def update(self, **params):
+        """
+        Actualiza los parámetros de la configuración, ignorando los valores None.
+
+        Args:
+            **params: Parámetros a sobrescribir (por ejemplo, num_nodes=100).
+
+        Raises:
+            ValueError: Si algún parámetro no existe en la configuración, su valor
+                no es del tipo del valor por defecto o está fuera de rango.
+        """
+        for key, value in params.items():
+            if key not in vars(self):
+                raise ValueError(f"Parámetro de configuración desconocido: '{key}'.")
+            if value is None:
+                continue
+            value = self._coerce(key, value)
+            self._check_range(key, value)
+            setattr(self, key, value)
+        return self
+
+    def _coerce(self, key, value):
+        """
+        Convierte un valor al tipo del valor por defecto del parámetro.
+        """
+        def is_number(x):
+            return isinstance(x, Real) and not isinstance(x, bool)
+
+        def is_point(x):
+            return isinstance(x, (list, tuple)) and len(x) == 2 and all(is_number(c) for c in x)
+
+        default = getattr(self, key)
+        if isinstance(default, int):
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+        elif isinstance(default, float):
+            if is_number(value):
+                return float(value)
+        elif isinstance(default, str):
+            if isinstance(value, str):
+                return value
+        elif isinstance(default, tuple):
+            if is_point(value):
+                return tuple(value)
+        elif isinstance(default, list):
+            if isinstance(value, (list, tuple)) and all(is_point(coord) for coord in value):
+                return [tuple(coord) for coord in value]
+        raise ValueError(
+            f"Valor inválido para '{key}': {value!r} (se esperaba un valor como {default!r})."
+        )
+
+    @staticmethod
+    def _check_range(key, value):
+        """
+        Verifica que un valor ya convertido esté dentro del rango admitido.
+        """
+        if key in MIN_VALUES and value < MIN_VALUES[key]:
+            raise ValueError(f"'{key}' debe ser mayor o igual a {MIN_VALUES[key]} (se recibió {value}).")
+        if key in POSITIVE_PARAMS:
+            components = value if isinstance(value, tuple) else (value,)
+            if any(c <= 0 for c in components):
+                raise ValueError(f"'{key}' debe ser positivo (se recibió {value}).")
+        if key == 'input_type' and value not in INPUT_TYPES:
+            raise ValueError(f"'{key}' debe ser uno de {INPUT_TYPES} (se recibió {value!r}).")
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Crea una configuración a partir de un archivo JSON. Los parámetros
+        que no aparecen en el archivo conservan su valor por defecto.
+
+        Args:
+            path (str): Ruta del archivo JSON.
+
+        Returns:
+            Config: Configuración cargada.
+
+        Raises:
+            OSError: Si no se puede leer el archivo.
+            ValueError: Si el archivo no es JSON válido o algún parámetro es inválido.
+        """
+        with open(path, encoding='utf-8') as f:
+            try:
+                params = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"El archivo de configuración {path} no es JSON válido: {e}.") from None
+        if not isinstance(params, dict):
+            raise ValueError(f"El archivo de configuración {path} debe contener un objeto JSON.")
+        return cls().update(**params)
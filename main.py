@@ -1,54 +1,258 @@
+import argparse
+import importlib
+import time
+from contextlib import contextmanager
+
 from config import Config
-from utils.graph_utils import generate_graph
-from utils.clustering import perform_clustering
-from utils.routing import  connect_splitters_to_olt_with_steiner, connect_splitters_to_olt, connect_users_to_splitters
-from utils.visualization import plot_graph, plot_clusters, plot_splitter_olt_connections, plot_mst_with_new_routes, plot_users_to_splitters
 
-def main():
-    # Configuración
-    config = Config()
+# Etapas del proceso, en orden de ejecución
+STAGES = ('grafo', 'clustering', 'steiner', 'mst', 'usuarios')
+ROUTING_STAGES = ('steiner', 'mst', 'usuarios')
 
-    # Paso 1: Generar el grafo inicial con la OLT incluida
-    print("Generando el grafo inicial con la OLT...")
-    graph, nodes = generate_graph(config)
+# Parámetros que solo afectan la generación del grafo y el clustering
+CLUSTERING_PARAMS = ('num_nodes', 'area', 'input_type', 'num_clusters',
+                     'max_distance_splitters', 'max_users_per_splitter')
 
-    # Paso 2: Realizar clustering con restricciones
-    print("Realizando clustering basado en nodos existentes del grafo...")
-    clusters, splitters, graph = perform_clustering(graph, nodes, config)
+# Módulo que necesita cada fase. Cada módulo importa sus dependencias pesadas
+# (scipy, sklearn_extra, matplotlib, networkx) al cargarse, por lo que importarlo
+# solo cuando la fase se ejecuta evita ese costo en las demás ejecuciones.
+MODULES = {
+    'cargar': 'utils.persistence',
+    'grafo': 'utils.graph_utils',
+    'clustering': 'utils.clustering',
+    'guardar': 'utils.persistence',
+    'steiner': 'utils.routing',
+    'mst': 'utils.routing',
+    'usuarios': 'utils.routing',
+    'visualización': 'utils.visualization',
+}
 
-    # Paso 3: Conectar usuarios a splitters
+# Fases cuya ejecución incluye el tiempo de espera de las ventanas de plt.show()
+DISPLAY_PHASES = ('visualización',)
 
 
-    # Visualización
-    print("Generando visualizaciones...")
-    plot_graph(graph, nodes, "Grafo Inicial con OLT")
-    plot_clusters(graph, nodes, clusters, splitters, "Clustering de nodos con Splitters")
+def parse_args(argv=None):
+    """
+    Interpreta los argumentos de línea de comandos y construye la configuración.
+
+    Args:
+        argv (list): Argumentos a interpretar (por defecto, sys.argv).
+
+    Returns:
+        args (argparse.Namespace): Argumentos con la lista de etapas ya resuelta.
+        config (Config): Configuración del proyecto.
+    """
+    parser = argparse.ArgumentParser(
+        description="Diseño topológico de una red de acceso óptica WDM."
+    )
+    parser.add_argument('--config', help="Archivo JSON con los parámetros de Config.")
+    parser.add_argument('--num-nodes', type=int, help="Número de nodos del grafo.")
+    parser.add_argument('--area', type=float, nargs=2, metavar=('ANCHO', 'ALTO'),
+                        help="Dimensiones del área en metros.")
+    parser.add_argument('--input-type', choices=('random', 'manual'), help="Tipo de entrada de nodos.")
+    parser.add_argument('--num-clusters', type=int, help="Número inicial de clústeres.")
+    parser.add_argument('--max-distance-splitters', type=float,
+                        help="Distancia máxima permitida a un splitter (en metros).")
+    parser.add_argument('--max-users-per-splitter', type=int,
+                        help="Capacidad máxima de usuarios por splitter.")
+    parser.add_argument('--etapas', nargs='+', choices=STAGES,
+                        help="Etapas a ejecutar; sus dependencias se agregan automáticamente "
+                             "(por defecto, todas).")
+    parser.add_argument('--cargar-clustering', metavar='ARCHIVO',
+                        help="Usa un clustering guardado en lugar de generar el grafo y clusterizar.")
+    parser.add_argument('--guardar-clustering', metavar='ARCHIVO',
+                        help="Guarda el resultado del clustering para reutilizarlo.")
+    parser.add_argument('--sin-graficos', action='store_true',
+                        help="No genera visualizaciones (no importa matplotlib).")
+    args = parser.parse_args(argv)
+
+    try:
+        config = build_config(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    requested = set(args.etapas or STAGES)
+    if args.cargar_clustering:
+        if args.etapas and requested & {'grafo', 'clustering'}:
+            parser.error("--cargar-clustering no es compatible con las etapas 'grafo' ni 'clustering'.")
+        ignored = [param for param in CLUSTERING_PARAMS if getattr(args, param) is not None]
+        if ignored:
+            flags = ', '.join('--' + param.replace('_', '-') for param in ignored)
+            parser.error(f"Los parámetros {flags} no tienen efecto con --cargar-clustering.")
+        defaults = Config()
+        ignored = [param for param in CLUSTERING_PARAMS
+                   if getattr(config, param) != getattr(defaults, param)]
+        if ignored:
+            parser.error(f"Los parámetros {', '.join(ignored)} de {args.config} "
+                         "no tienen efecto con --cargar-clustering.")
+        requested -= {'grafo', 'clustering'}
+        if not requested:
+            parser.error("--cargar-clustering requiere al menos una etapa de ruteo.")
+    else:
+        # El ruteo necesita el clustering y el clustering necesita el grafo
+        if requested & set(ROUTING_STAGES):
+            requested.add('clustering')
+        if 'clustering' in requested:
+            requested.add('grafo')
+    if args.guardar_clustering and 'clustering' not in requested:
+        parser.error("--guardar-clustering requiere ejecutar la etapa 'clustering'.")
+
+    args.etapas = [stage for stage in STAGES if stage in requested]
+    return args, config
+
+
+def build_config(args):
+    """
+    Construye la configuración a partir del archivo indicado y de los argumentos,
+    que tienen prioridad sobre el archivo.
+
+    Args:
+        args (argparse.Namespace): Argumentos de línea de comandos.
+
+    Returns:
+        Config: Configuración del proyecto.
+
+    Raises:
+        OSError: Si no se puede leer el archivo de configuración.
+        ValueError: Si el archivo no es JSON válido o algún parámetro es inválido.
+    """
+    config = Config.from_file(args.config) if args.config else Config()
+    return config.update(
+        num_nodes=args.num_nodes,
+        area=args.area,
+        input_type=args.input_type,
+        num_clusters=args.num_clusters,
+        max_distance_splitters=args.max_distance_splitters,
+        max_users_per_splitter=args.max_users_per_splitter,
+    )
+
 
-    # Paso 4: Conectar splitters a la OLT utilizando Árbol de Steiner con todos los nodos
-    print("Conectando splitters a la OLT utilizando Árbol de Steiner...")
-    splitter_olt_graph = connect_splitters_to_olt_with_steiner(graph, splitters, config)
+@contextmanager
+def measure(times, phase, kind):
+    """
+    Acumula en times[phase][kind] la duración del bloque ('import' o 'run').
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phase_times = times.setdefault(phase, {'import': 0.0, 'run': 0.0})
+        phase_times[kind] += time.perf_counter() - start
+
+
+def import_phase(times, phase):
+    """
+    Importa el módulo de una fase midiendo su costo de arranque.
+
+    Returns:
+        module: Módulo indicado en MODULES[phase].
+    """
+    with measure(times, phase, 'import'):
+        return importlib.import_module(MODULES[phase])
+
+
+def report_times(times):
+    """
+    Imprime el costo de importación y de ejecución de cada fase. Las fases de
+    visualización se informan aparte y no suman al total, ya que su ejecución
+    incluye el tiempo que las ventanas permanecen abiertas.
+    """
+    compute = {phase: t for phase, t in times.items() if phase not in DISPLAY_PHASES}
+    display = {phase: t for phase, t in times.items() if phase in DISPLAY_PHASES}
+
+    print("\nTiempos por etapa (s):")
+    print(f"{'Etapa':<15}{'Importación':>13}{'Ejecución':>13}")
+    for phase, t in compute.items():
+        print(f"{phase:<15}{t['import']:>13.3f}{t['run']:>13.3f}")
+    total_import = sum(t['import'] for t in compute.values())
+    total_run = sum(t['run'] for t in compute.values())
+    print(f"{'Total':<15}{total_import:>13.3f}{total_run:>13.3f}")
+    for phase, t in display.items():
+        print(f"{phase:<15}{t['import']:>13.3f}{t['run']:>13.3f}"
+              "  (tiempo real, incluye ventanas abiertas; fuera del total)")
+
+
+def main(argv=None):
+    # Configuración
+    args, config = parse_args(argv)
+    times = {}
+    stages = args.etapas
+    plot = not args.sin_graficos
+
+    def visualize(function, *params, **kwargs):
+        visualization = import_phase(times, 'visualización')
+        with measure(times, 'visualización', 'run'):
+            getattr(visualization, function)(*params, **kwargs)
+
+    if args.cargar_clustering:
+        persistence = import_phase(times, 'cargar')
+        print(f"Cargando clustering desde {args.cargar_clustering}...")
+        with measure(times, 'cargar', 'run'):
+            graph, nodes, clusters, splitters = persistence.load_clustering(args.cargar_clustering)
+
+    # Paso 1: Generar el grafo inicial con la OLT incluida
+    if 'grafo' in stages:
+        graph_utils = import_phase(times, 'grafo')
+        print("Generando el grafo inicial con la OLT...")
+        with measure(times, 'grafo', 'run'):
+            graph, nodes = graph_utils.generate_graph(config)
+
+    # Paso 2: Realizar clustering con restricciones
+    if 'clustering' in stages:
+        clustering = import_phase(times, 'clustering')
+        print("Realizando clustering basado en nodos existentes del grafo...")
+        with measure(times, 'clustering', 'run'):
+            clusters, splitters, graph = clustering.perform_clustering(graph, nodes, config)
+        if args.guardar_clustering:
+            persistence = import_phase(times, 'guardar')
+            print(f"Guardando clustering en {args.guardar_clustering}...")
+            with measure(times, 'guardar', 'run'):
+                persistence.save_clustering(args.guardar_clustering, graph, nodes, clusters, splitters)
 
     # Visualización
-    print("Generando visualización del Árbol de Steiner...")
-    plot_splitter_olt_connections(splitter_olt_graph, "Conexión de Splitters a la OLT (Steiner Subóptimo)")
+    if plot and 'grafo' in stages:
+        print("Generando visualizaciones...")
+        visualize('plot_graph', graph, nodes, "Grafo Inicial con OLT")
+    if plot and 'clustering' in stages:
+        visualize('plot_clusters', graph, nodes, clusters, splitters, "Clustering de nodos con Splitters")
+
+    # Paso 3: Conectar splitters a la OLT utilizando Árbol de Steiner con todos los nodos
+    if 'steiner' in stages:
+        routing = import_phase(times, 'steiner')
+        print("Conectando splitters a la OLT utilizando Árbol de Steiner...")
+        with measure(times, 'steiner', 'run'):
+            splitter_olt_graph = routing.connect_splitters_to_olt_with_steiner(graph, splitters, config)
 
-# Generar nuevas rutas
-    print("Generando nuevas rutas para el Árbol de Steiner...")
-    new_routes_graph = connect_splitters_to_olt(graph, splitters, config)
+        if plot:
+            print("Generando visualización del Árbol de Steiner...")
+            visualize('plot_splitter_olt_connections', splitter_olt_graph,
+                      "Conexión de Splitters a la OLT (Steiner Subóptimo)")
 
-    # Visualizar el grafo original y las nuevas rutas
-    print("Visualizando las nuevas rutas junto con el grafo original...")
-    plot_mst_with_new_routes(graph, new_routes_graph, title="Grafo de rutas para el Árbol de MST")
+    # Paso 4: Generar nuevas rutas
+    if 'mst' in stages:
+        routing = import_phase(times, 'mst')
+        print("Generando nuevas rutas para el Árbol de Steiner...")
+        with measure(times, 'mst', 'run'):
+            new_routes_graph = routing.connect_splitters_to_olt(graph, splitters, config)
 
-    # Conectar usuarios a splitters
-    print("Conectando usuarios a splitters...")
-    user_splitter_graph = connect_users_to_splitters(graph, clusters, config)
+        if plot:
+            print("Visualizando las nuevas rutas junto con el grafo original...")
+            visualize('plot_mst_with_new_routes', graph, new_routes_graph,
+                      title="Grafo de rutas para el Árbol de MST")
 
-    # Visualizar las conexiones entre usuarios y splitters
-    print("Visualizando conexiones de usuarios a splitters...")
-    plot_users_to_splitters(graph, user_splitter_graph, clusters, title="Conexiones de Usuarios a Splitters")
+    # Paso 5: Conectar usuarios a splitters
+    if 'usuarios' in stages:
+        routing = import_phase(times, 'usuarios')
+        print("Conectando usuarios a splitters...")
+        with measure(times, 'usuarios', 'run'):
+            user_splitter_graph = routing.connect_users_to_splitters(graph, clusters, config)
 
+        if plot:
+            print("Visualizando conexiones de usuarios a splitters...")
+            visualize('plot_users_to_splitters', graph, user_splitter_graph, clusters,
+                      title="Conexiones de Usuarios a Splitters")
 
+    report_times(times)
     print("Proceso completado con éxito.")
 
 if __name__ == "__main__":
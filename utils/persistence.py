@@ -0,0 +1,42 @@
+import pickle
+import numpy as np
+import networkx as nx
+
+def save_clustering(path, graph, nodes, clusters, splitters):
+    """
+    Guarda el resultado del clustering para poder ejecutar el ruteo posteriormente
+    sin repetir la generación del grafo ni el clustering.
+
+    Args:
+        path (str): Ruta del archivo de salida.
+        graph (nx.Graph): Grafo con los splitters etiquetados.
+        nodes (np.ndarray): Coordenadas de los nodos.
+        clusters (dict): Clústeres generados.
+        splitters (list): Nodos seleccionados como splitters.
+    """
+    data = {'graph': graph, 'nodes': nodes, 'clusters': clusters, 'splitters': splitters}
+    with open(path, 'wb') as f:
+        pickle.dump(data, f)
+
+
+def load_clustering(path):
+    """
+    Carga un resultado de clustering guardado con save_clustering.
+
+    Args:
+        path (str): Ruta del archivo guardado.
+
+    Returns:
+        graph (nx.Graph): Grafo con los splitters etiquetados.
+        nodes (np.ndarray): Coordenadas de los nodos.
+        clusters (dict): Clústeres generados.
+        splitters (list): Nodos seleccionados como splitters.
+
+    Raises:
+        ValueError: Si el archivo no contiene un clustering guardado con save_clustering.
+    """
+    with open(path, 'rb') as f:
+        data = pickle.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get('graph'), nx.Graph):
+        raise ValueError(f"El archivo {path} no contiene un clustering válido.")
+    return data['graph'], np.asarray(data['nodes']), data['clusters'], data['splitters']